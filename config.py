@@ -12,7 +12,8 @@ ECHO_PIN = 24
 # HC-SR04 Sensor settings (optimized for accuracy)
 SETTLE_TIME = 0.1  # seconds - reduced from 2s to 0.1s for HC-SR04
 PULSE_DURATION = 0.00001  # 10 microseconds (correct for HC-SR04)
-ECHO_TIMEOUT = 0.1  # seconds - timeout for echo response
+PRECISE_TRIGGER = True  # busy-wait the trigger pulse; time.sleep overshoots 10us
+ECHO_TIMEOUT = None  # seconds - echo timeout; None derives it from MAX_DISTANCE (~29ms)
 
 # Real-time update settings
 UPDATE_INTERVAL = 1.0  # seconds between measurements
@@ -26,13 +26,23 @@ __license__ = "MIT"
 __url__ = "https://github.com/kagamirudo/hc-sr04-driver"
 
 # Import main classes and functions
-from .sensor import HCSR04Sensor
-from .config import HCSR04Config
+from .config import HCSR04Config, Thresholds
+
+
+def __getattr__(name):
+    """Import HCSR04Sensor on first access (PEP 562) so config-only users stay light"""
+    if name == "HCSR04Sensor":
+        from .sensor import HCSR04Sensor
+        globals()[name] = HCSR04Sensor
+        return HCSR04Sensor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Make main classes available at package level
 __all__ = [
     "HCSR04Sensor",
     "HCSR04Config",
+    "Thresholds",
     "__version__",
     "__author__",
     "__license__",
@@ -0,0 +1,106 @@
+# cython: language_level=3
+"""
+C fast path for the HC-SR04 trigger/echo timing loop
+
+Talks to the lgpio C library (liblgpio) directly and releases the GIL while
+it spins on the echo pin. Built by setup.py only when Cython and liblgpio
+are available; the sensor falls back to the Python lgpio path otherwise.
+"""
+
+cdef extern from "lgpio.h" nogil:
+    int lgGpiochipOpen(int gpioDev)
+    int lgGpiochipClose(int handle)
+    int lgGpioClaimOutput(int handle, int lFlags, int gpio, int level)
+    int lgGpioClaimInput(int handle, int lFlags, int gpio)
+    int lgGpioRead(int handle, int gpio)
+    int lgGpioWrite(int handle, int gpio, int level)
+
+cdef extern from "<time.h>" nogil:
+    ctypedef long time_t
+    cdef struct timespec:
+        time_t tv_sec
+        long tv_nsec
+    int clock_gettime(int clk_id, timespec *tp)
+    int CLOCK_MONOTONIC
+
+
+cdef inline long long _now_ns() noexcept nogil:
+    cdef timespec ts
+    clock_gettime(CLOCK_MONOTONIC, &ts)
+    return <long long>ts.tv_sec * 1000000000 + ts.tv_nsec
+
+
+cdef long long _ping(int h, int trig, int echo, long long pulse_ns,
+                     long long timeout_ns) noexcept nogil:
+    """Fire one trigger pulse and time the echo; returns ns, or -1 on timeout"""
+    cdef long long t0, pulse_start, pulse_end
+
+    # Send trigger pulse
+    lgGpioWrite(h, trig, 1)
+    t0 = _now_ns()
+    while _now_ns() - t0 < pulse_ns:
+        pass
+    lgGpioWrite(h, trig, 0)
+
+    # Wait for echo start
+    t0 = _now_ns()
+    while lgGpioRead(h, echo) == 0:
+        if _now_ns() - t0 > timeout_ns:
+            return -1
+    pulse_start = _now_ns()
+
+    # Wait for echo end
+    while lgGpioRead(h, echo) == 1:
+        if _now_ns() - pulse_start > timeout_ns:
+            return -1
+    pulse_end = _now_ns()
+
+    return pulse_end - pulse_start
+
+
+cdef class Pinger:
+    """Owns a gpiochip handle with TRIG claimed as output and ECHO as input"""
+
+    cdef int _h
+    cdef int _trig
+    cdef int _echo
+
+    def __cinit__(self, int chip, int trig_pin, int echo_pin):
+        self._h = -1
+        h = lgGpiochipOpen(chip)
+        if h < 0:
+            raise OSError(f"lgGpiochipOpen({chip}) failed: {h}")
+        if lgGpioClaimOutput(h, 0, trig_pin, 0) < 0 or \
+                lgGpioClaimInput(h, 0, echo_pin) < 0:
+            lgGpiochipClose(h)
+            raise OSError(f"Could not claim GPIO {trig_pin}/{echo_pin}")
+        self._h = h
+        self._trig = trig_pin
+        self._echo = echo_pin
+
+    def ping(self, long long pulse_ns, long long timeout_ns):
+        """
+        Take one measurement
+
+        Returns:
+            Echo pulse width in nanoseconds, or None on echo timeout
+        """
+        cdef long long width
+        if self._h < 0:
+            raise ValueError("Pinger is closed")
+        with nogil:
+            width = _ping(self._h, self._trig, self._echo, pulse_ns,
+                          timeout_ns)
+        if width < 0:
+            return None
+        return width
+
+    def close(self):
+        """Release the pins and close the gpiochip handle"""
+        if self._h >= 0:
+            lgGpiochipClose(self._h)
+            self._h = -1
+
+    def __dealloc__(self):
+        if self._h >= 0:
+            lgGpiochipClose(self._h)
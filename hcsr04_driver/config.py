@@ -4,29 +4,75 @@ Configuration module for HC-SR04 Ultrasonic Sensor Driver
 """
 
 import os
-from dataclasses import dataclass
-from typing import Dict, Any
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Dict, Any, NamedTuple, Optional, Tuple, Union, cast
 
+# Headroom over the ideal round-trip time when deriving echo_timeout
+ECHO_TIMEOUT_MARGIN = 1.2
+# Fixed delay before the round trip starts (seconds): the sensor sends an
+# 8-cycle 40kHz burst and raises ECHO several hundred us after TRIG, and
+# lgpio dispatches the edge callbacks late on top of that
+ECHO_START_ALLOWANCE = 0.001
 
-@dataclass
+# Values computed in HCSR04Config.__post_init__ rather than passed in
+_DERIVED_FIELDS = ('cm_per_second_half', 'cm_per_us_half', 'cm_per_ns_half')
+
+
+class Thresholds(NamedTuple):
+    """Upper bounds (cm) of the distance status bands"""
+    very_close: float = 5.0
+    close: float = 30.0
+    medium: float = 100.0
+    far: float = 200.0
+
+    def __getitem__(self, key):  # type: ignore[override]
+        """Index by position, or by band name as the old thresholds dict was"""
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+
+@dataclass(frozen=True)
 class HCSR04Config:
     """
     Configuration class for HC-SR04 ultrasonic sensor
+
+    Instances are immutable and hashable; use dataclasses.replace() to
+    derive a modified copy.
     
     Attributes:
         trig_pin: GPIO pin for trigger signal
         echo_pin: GPIO pin for echo signal
-        settle_time: Time to wait for sensor to settle (seconds)
+        settle_time: Time to wait for sensor to settle (seconds). Applied
+            only after the sensor has been idle for longer than
+            max(1s, 2 * update_interval)
         pulse_duration: Duration of trigger pulse (seconds)
-        echo_timeout: Timeout for echo response (seconds)
+        precise_trigger: Hold the trigger pulse with a busy-wait instead of
+            time.sleep(), which overshoots 10us by 50-200us. Disable on
+            heavily loaded systems to avoid spinning a core
+        echo_timeout: Timeout for echo response (seconds). Derived from
+            max_distance when not given (~29ms for 400cm)
         update_interval: Interval between measurements (seconds)
+        samples_per_measurement: Pings per measure_distance() call. The
+            default 1 takes a single ping; above 1 the median is returned,
+            so occasional wild echoes are rejected
+        stats_window: Number of recent measurements kept for statistics
         sound_speed: Speed of sound in cm/s
         min_distance: Minimum reliable distance (cm)
         max_distance: Maximum reliable distance (cm)
         use_mock_gpio: Whether to use mock GPIO mode
         mock_min_distance: Minimum mock distance (cm)
         mock_max_distance: Maximum mock distance (cm)
-        distance_thresholds: Distance thresholds for status indicators
+        distance_thresholds: Distance thresholds for status indicators.
+            Accepts a Thresholds or a dict with the same keys
+
+    Derived (computed in __post_init__, not constructor arguments):
+        cm_per_second_half: sound_speed / round_trip_divisor
+        cm_per_us_half: cm_per_second_half expressed per microsecond
+        cm_per_ns_half: cm_per_second_half expressed per nanosecond
     """
     
     # GPIO pin configuration
@@ -36,10 +82,13 @@ class HCSR04Config:
     # Sensor timing settings
     settle_time: float = 0.1
     pulse_duration: float = 0.00001  # 10 microseconds
-    echo_timeout: float = 0.1
+    precise_trigger: bool = True
+    echo_timeout: Optional[float] = None  # derived from max_distance
     
     # Update settings
     update_interval: float = 1.0
+    samples_per_measurement: int = 1
+    stats_window: int = 100
     
     # Distance calculation constants
     sound_speed: float = 34300  # cm/s at 20°C
@@ -55,21 +104,88 @@ class HCSR04Config:
     mock_max_distance: float = 200.0
     
     # Distance thresholds for status indicators (cm)
-    distance_thresholds: Dict[str, float] = None
+    # Always a Thresholds after __post_init__
+    distance_thresholds: Union[Thresholds, Dict[str, float], None] = Thresholds()
+
+    # Set by __post_init__. Declared here so the attributes are typed (and
+    # become struct fields when compiled with mypyc); excluded from
+    # __init__, repr and comparisons.
+    cm_per_second_half: float = field(init=False, repr=False, compare=False)
+    cm_per_us_half: float = field(init=False, repr=False, compare=False)
+    cm_per_ns_half: float = field(init=False, repr=False, compare=False)
+    _sorted_boundaries: Tuple[float, ...] = field(
+        init=False, repr=False, compare=False)
+    _sorted_labels: Tuple[str, ...] = field(
+        init=False, repr=False, compare=False)
+    # Whether echo_timeout was derived from max_distance rather than given
+    _echo_timeout_derived: bool = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        """Set default distance thresholds if not provided"""
-        if self.distance_thresholds is None:
-            self.distance_thresholds = {
-                'very_close': 5.0,
-                'close': 30.0,
-                'medium': 100.0,
-                'far': 200.0
-            }
+        """Normalise distance thresholds and precompute derived constants"""
+        thresholds = self.distance_thresholds
+        if thresholds is None:
+            thresholds = Thresholds()
+        elif isinstance(thresholds, dict):
+            thresholds = Thresholds(**thresholds)
+        thresholds = Thresholds(*(float(v) for v in thresholds))
+        object.__setattr__(self, 'distance_thresholds', thresholds)
+
+        # Parallel arrays, sorted by distance, for bisect lookups in
+        # get_distance_status
+        ordered = sorted(zip(thresholds, Thresholds._fields))
+        object.__setattr__(self, '_sorted_boundaries',
+                           tuple(v for v, _ in ordered))
+        object.__setattr__(self, '_sorted_labels',
+                           tuple(k for _, k in ordered))
+
+        # No point waiting longer than an echo from max_distance can take
+        derived = self.echo_timeout is None and self.sound_speed > 0
+        object.__setattr__(self, '_echo_timeout_derived', derived)
+        if derived:
+            object.__setattr__(self, 'echo_timeout',
+                               self.timeout_for_range(self.max_distance))
+
+        # Fold the round-trip division into a single multiplier so a
+        # measurement is just `elapsed * cm_per_second_half`. A bad divisor
+        # is left for validate() to report like any other bad field.
+        divisor = self.round_trip_divisor
+        cm_per_second_half = self.sound_speed / divisor if divisor > 0 else 0.0
+        object.__setattr__(self, 'cm_per_second_half', cm_per_second_half)
+        object.__setattr__(self, 'cm_per_us_half',
+                           cm_per_second_half / 1_000_000)
+        object.__setattr__(self, 'cm_per_ns_half',
+                           cm_per_second_half / 1_000_000_000)
     
+    def timeout_for_range(self, distance: float) -> float:
+        """Echo timeout (seconds) from the trigger, for objects up to ``distance`` cm"""
+        return ECHO_START_ALLOWANCE + \
+            (self.round_trip_divisor * distance / self.sound_speed) * \
+            ECHO_TIMEOUT_MARGIN
+
+    def with_environment(self, temp_c: float,
+                         humidity_pct: float = 0.0) -> 'HCSR04Config':
+        """
+        Return a copy with sound_speed compensated for air conditions
+
+        The derived conversion constants are recomputed once here rather
+        than per measurement, as is echo_timeout unless it was given
+        explicitly.
+
+        Args:
+            temp_c: Air temperature in degrees Celsius
+            humidity_pct: Relative humidity in percent
+        """
+        sound_speed = 33140 + 60.6 * temp_c + 1.24 * humidity_pct  # cm/s
+        # replace() would carry over a timeout derived from the old speed
+        echo_timeout = None if self._echo_timeout_derived else self.echo_timeout
+        return replace(self, sound_speed=sound_speed, echo_timeout=echo_timeout)
+
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> 'HCSR04Config':
         """Create configuration from dictionary"""
+        # Derived constants are recomputed, so accept them from to_dict() output
+        config_dict = {k: v for k, v in config_dict.items()
+                       if k not in _DERIVED_FIELDS}
         return cls(**config_dict)
     
     def to_dict(self) -> Dict[str, Any]:
@@ -79,8 +195,13 @@ class HCSR04Config:
             'echo_pin': self.echo_pin,
             'settle_time': self.settle_time,
             'pulse_duration': self.pulse_duration,
-            'echo_timeout': self.echo_timeout,
+            'precise_trigger': self.precise_trigger,
+            # None for a derived timeout, so from_dict() derives it again
+            'echo_timeout':
+                None if self._echo_timeout_derived else self.echo_timeout,
             'update_interval': self.update_interval,
+            'samples_per_measurement': self.samples_per_measurement,
+            'stats_window': self.stats_window,
             'sound_speed': self.sound_speed,
             'round_trip_divisor': self.round_trip_divisor,
             'min_distance': self.min_distance,
@@ -88,26 +209,42 @@ class HCSR04Config:
             'use_mock_gpio': self.use_mock_gpio,
             'mock_min_distance': self.mock_min_distance,
             'mock_max_distance': self.mock_max_distance,
-            'distance_thresholds': self.distance_thresholds.copy()
+            'distance_thresholds':
+                cast(Thresholds, self.distance_thresholds)._asdict(),
+            'cm_per_second_half': self.cm_per_second_half,
+            'cm_per_us_half': self.cm_per_us_half,
+            'cm_per_ns_half': self.cm_per_ns_half
         }
     
     def validate(self) -> bool:
         """Validate configuration parameters"""
-        if self.min_distance < 0:
-            raise ValueError("min_distance must be positive")
-        if self.max_distance <= self.min_distance:
-            raise ValueError("max_distance must be greater than min_distance")
-        if self.settle_time < 0:
-            raise ValueError("settle_time must be positive")
-        if self.pulse_duration < 0:
-            raise ValueError("pulse_duration must be positive")
-        if self.echo_timeout < 0:
-            raise ValueError("echo_timeout must be positive")
-        if self.update_interval < 0:
-            raise ValueError("update_interval must be positive")
-        if self.sound_speed <= 0:
-            raise ValueError("sound_speed must be positive")
-        return True
+        return _validate(self)
+
+
+@lru_cache(maxsize=32)
+def _validate(config: HCSR04Config) -> bool:
+    """Validate a configuration; results are cached since configs are frozen"""
+    if config.min_distance < 0:
+        raise ValueError("min_distance must be positive")
+    if config.max_distance <= config.min_distance:
+        raise ValueError("max_distance must be greater than min_distance")
+    if config.settle_time < 0:
+        raise ValueError("settle_time must be positive")
+    if config.pulse_duration < 0:
+        raise ValueError("pulse_duration must be positive")
+    if config.sound_speed <= 0:
+        raise ValueError("sound_speed must be positive")
+    if config.round_trip_divisor <= 0:
+        raise ValueError("round_trip_divisor must be positive")
+    if config.echo_timeout is None or config.echo_timeout < 0:
+        raise ValueError("echo_timeout must be positive")
+    if config.update_interval < 0:
+        raise ValueError("update_interval must be positive")
+    if config.samples_per_measurement < 1:
+        raise ValueError("samples_per_measurement must be at least 1")
+    if config.stats_window < 1:
+        raise ValueError("stats_window must be at least 1")
+    return True
 
 
 # Default configuration instance
@@ -10,27 +10,49 @@ This module demonstrates various ways to use the sensor driver:
 5. Advanced configuration
 """
 
+import sys
+
 # Global GPIO pin configuration
 TRIG_PIN = 23
 ECHO_PIN = 24
 
+# Callback output line, built once instead of an f-string per reading
+_LINE = "📏 {:6.2f} cm - {}\n"
+
 # Handle both package and standalone execution
 try:
-    from .sensor import HCSR04Sensor
     from .config import HCSR04Config
 except ImportError:
     # Standalone execution
-    from sensor import HCSR04Sensor
     from config import HCSR04Config
 
 
-def basic_usage():
-    """Basic usage example"""
+def _sensor_class():
+    """Import HCSR04Sensor on first use so importing the examples stays cheap"""
+    try:
+        from .sensor import HCSR04Sensor
+    except ImportError:
+        # Standalone execution
+        from sensor import HCSR04Sensor
+    return HCSR04Sensor
+
+
+def basic_usage(sensor=None):
+    """
+    Basic usage example
+
+    Args:
+        sensor: Sensor to use; a default-configured one is created (and
+            cleaned up) when not given
+    """
+    HCSR04Sensor = _sensor_class()
+    owns_sensor = sensor is None
     print("=== Basic Usage Example ===")
 
     try:
         # Create sensor with default configuration
-        sensor = HCSR04Sensor()
+        if owns_sensor:
+            sensor = HCSR04Sensor()
 
         # Single measurement
         distance = sensor.measure_distance()
@@ -45,12 +67,13 @@ def basic_usage():
         print(f"❌ Error: {e}")
     finally:
         # Cleanup
-        if 'sensor' in locals():
+        if owns_sensor and sensor is not None:
             sensor.cleanup()
 
 
 def custom_configuration():
     """Custom configuration example"""
+    HCSR04Sensor = _sensor_class()
     print("\n=== Custom Configuration Example ===")
 
     try:
@@ -89,19 +112,35 @@ def custom_configuration():
             sensor.cleanup()
 
 
-def callback_monitoring():
-    """Callback-based monitoring example"""
+def callback_monitoring(sensor=None):
+    """
+    Callback-based monitoring example
+
+    Args:
+        sensor: Sensor to use; a default-configured one is created (and
+            cleaned up) when not given
+    """
+    HCSR04Sensor = _sensor_class()
+    owns_sensor = sensor is None
     print("\n=== Callback Monitoring Example ===")
     print("Press Ctrl+C to stop monitoring")
 
     def distance_callback(distance: float, status: str):
         """Custom callback function"""
-        print(f"📏 {distance:6.2f} cm - {status}")
+        sys.stdout.write(_LINE.format(distance, status))
 
     # Create sensor and start monitoring with callback
-    sensor = HCSR04Sensor()
+    if owns_sensor:
+        sensor = HCSR04Sensor()
 
     try:
+        # Near-field check: the echo timeout shrinks to match the 50cm cap
+        distance = sensor.measure_distance(max_cm=50)
+        if distance:
+            print(f"Object within 50 cm: {distance} cm")
+        else:
+            print("Nothing within 50 cm")
+
         # Start monitoring with custom callback
         sensor.start_monitoring(callback=distance_callback)
     except KeyboardInterrupt:
@@ -109,27 +148,42 @@ def callback_monitoring():
     except Exception as e:
         print(f"❌ Error: {e}")
     finally:
-        sensor.cleanup()
+        if owns_sensor:
+            sensor.cleanup()
 
 
-def context_manager_usage():
-    """Context manager usage example"""
+def _take_measurements(sensor, count=3):
+    """Print a few single measurements"""
+    for i in range(count):
+        try:
+            distance = sensor.measure_distance()
+            if distance:
+                print(f"Measurement {i+1}: {distance} cm")
+            else:
+                print(f"Measurement {i+1}: Failed")
+        except KeyboardInterrupt:
+            print(f"\n⏹️  Stopped at measurement {i+1}")
+            break
+
+
+def context_manager_usage(sensor=None):
+    """
+    Context manager usage example
+
+    Args:
+        sensor: Sensor to use; when given, the caller's context manager
+            owns it and it is not cleaned up here
+    """
+    HCSR04Sensor = _sensor_class()
     print("\n=== Context Manager Example ===")
 
     try:
-        # Use context manager for automatic cleanup
-        with HCSR04Sensor() as sensor:
-            # Take a few measurements
-            for i in range(3):
-                try:
-                    distance = sensor.measure_distance()
-                    if distance:
-                        print(f"Measurement {i+1}: {distance} cm")
-                    else:
-                        print(f"Measurement {i+1}: Failed")
-                except KeyboardInterrupt:
-                    print(f"\n⏹️  Stopped at measurement {i+1}")
-                    break
+        if sensor is not None:
+            _take_measurements(sensor)
+        else:
+            # Use context manager for automatic cleanup
+            with HCSR04Sensor() as sensor:
+                _take_measurements(sensor)
 
     except KeyboardInterrupt:
         print("\n⏹️  Stopped by user")
@@ -141,6 +195,7 @@ def context_manager_usage():
 
 def advanced_configuration():
     """Advanced configuration example"""
+    HCSR04Sensor = _sensor_class()
     print("\n=== Advanced Configuration Example ===")
 
     try:
@@ -189,18 +244,29 @@ def advanced_configuration():
             sensor.cleanup()
 
 
-def statistics_example():
-    """Statistics tracking example"""
+def statistics_example(sensor=None):
+    """
+    Statistics tracking example
+
+    Args:
+        sensor: Sensor to use; a default-configured one is created (and
+            cleaned up) when not given. Its earlier measurements are
+            cleared so the statistics cover this example only
+    """
+    HCSR04Sensor = _sensor_class()
+    owns_sensor = sensor is None
     print("\n=== Statistics Example ===")
 
     try:
-        sensor = HCSR04Sensor()
+        if owns_sensor:
+            sensor = HCSR04Sensor()
+        sensor.reset_statistics()
 
-        # Take several measurements
+        # Take several measurements, each the median of 5 pings
         measurements = []
         for i in range(10):
             try:
-                distance = sensor.measure_distance()
+                distance = sensor.measure_distance_median(5)
                 if distance:
                     measurements.append(distance)
                     print(f"Measurement {i+1}: {distance} cm")
@@ -226,24 +292,31 @@ def statistics_example():
         print(f"❌ Error: {e}")
     finally:
         # Cleanup
-        if 'sensor' in locals():
+        if owns_sensor and sensor is not None:
             sensor.cleanup()
 
 
 def run_all_examples():
     """Run all examples"""
+    HCSR04Sensor = _sensor_class()
     print("HC-SR04 Driver Examples")
     print("=" * 50)
     print("Press Ctrl+C at any time to stop an example")
     print()
 
     try:
-        basic_usage()
-        custom_configuration()
-        callback_monitoring()
-        context_manager_usage()
+        # The default-configuration examples share one sensor, so the GPIO
+        # library is opened and the pins claimed only once. The custom and
+        # advanced examples need their own configuration, and the advanced
+        # one claims the same pins, so it runs after the shared sensor is
+        # released.
+        with HCSR04Sensor() as sensor:
+            basic_usage(sensor)
+            custom_configuration()
+            callback_monitoring(sensor)
+            context_manager_usage(sensor)
+            statistics_example(sensor)
         advanced_configuration()
-        statistics_example()
 
         print("\n" + "=" * 50)
         print("All examples completed successfully!")
@@ -6,11 +6,22 @@ A professional, production-ready driver for the HC-SR04 ultrasonic distance sens
 Supports both lgpio (recommended for Pi 5) and RPi.GPIO libraries.
 """
 
+import sys
 import time
-import threading
+import array
 import random
+import threading
+import statistics
+from bisect import bisect_right
+from collections import deque
 from typing import Optional, Callable, List
 
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional; statistics fall back to pure Python reductions
+    np = None
+
 # Handle both package and standalone execution
 try:
     from .config import HCSR04Config, DEFAULT_CONFIG
@@ -18,6 +29,63 @@ except ImportError:
     # Standalone execution
     from config import HCSR04Config, DEFAULT_CONFIG
 
+try:
+    from ._ping import Pinger
+except ImportError:
+    # C fast path not built; lgpio measurements use the Python edge callbacks
+    Pinger = None
+
+# Echo slot states
+_IDLE = 0
+_PENDING = 1
+_DONE = 2
+# Trigger held back by pacing until fire_at; sent by a later poll
+_SCHEDULED = 3
+
+# Status shown for distances below each named threshold
+_STATUS_LABELS = {
+    'very_close': "🟢 Very Close",
+    'close': "🟢 Close",
+    'medium': "🟡 Medium",
+    'far': "🟠 Far",
+}
+_EXTREMELY_CLOSE = 1.0  # cm
+_EXTREMELY_CLOSE_LABEL = "🔴 Extremely Close"
+_VERY_FAR_LABEL = "🔴 Very Far"
+
+# Settle the sensor only after it has been idle at least this long (ns); the
+# per-instance threshold is max(this, 2 * update_interval) so a regular
+# monitoring loop never lands on the boundary and settles at random
+_SETTLE_AFTER_NS = 1_000_000_000
+# Datasheet minimum between triggers, so stray echoes do not overlap (ns)
+_MIN_PING_GAP_NS = 60_000_000
+
+# Readings buffered between the monitoring producer thread and the consumer
+_READINGS_MAXLEN = 1000
+
+# How often the monitoring consumer re-checks `running` while idle (seconds)
+_CONSUMER_POLL_S = 0.1
+
+# start_monitoring output lines, built once rather than as f-strings per loop
+_READING_FMT = "[{}] Distance: {:6.2f} cm {}\n".format
+_STATS_FMT = (
+    "    Stats: Avg={average:5.1f}, Min={minimum:5.1f}, Max={maximum:5.1f} cm\n"
+    "    Running for: {duration:.1f}s, Total: {count}\n"
+    + "-" * 40 + "\n"
+).format_map
+
+
+def _busy_wait_ns(ns: int):
+    """
+    Spin for ns nanoseconds
+
+    time.sleep() cannot hold a 10us trigger pulse: nanosleep on a non-RT
+    kernel overshoots by 50-200us.
+    """
+    end = time.perf_counter_ns() + ns
+    while time.perf_counter_ns() < end:
+        pass
+
 
 class MockGPIO:
     """Mock GPIO class for development and testing"""
@@ -40,13 +108,32 @@ class MockGPIO:
 
     @staticmethod
     def input(pin):
-        return random.choice([0, 1])
+        # One random bit, without building a list and drawing a float
+        return random.getrandbits(1)
 
     @staticmethod
     def cleanup():
         pass
 
 
+class _EchoSlot:
+    """Result slot for one in-flight measurement, filled by the echo edge callback"""
+
+    __slots__ = ('state', 't_rise', 't_fall', 'deadline', 'max_distance',
+                 'result', 'done', 'fire_at', 'timeout_ns')
+
+    def __init__(self):
+        self.state = _IDLE
+        self.done = threading.Event()
+        self.t_rise = 0
+        self.t_fall = 0
+        self.deadline = 0
+        self.max_distance = 0.0
+        self.result = None
+        self.fire_at = 0
+        self.timeout_ns = 0
+
+
 class HCSR04Sensor:
     """
     Professional HC-SR04 ultrasonic sensor driver
@@ -58,8 +145,36 @@ class HCSR04Sensor:
     - Comprehensive error handling
     - Statistics tracking
     - Mock mode support
+
+    measure_distance_once(max_cm=None) is bound per instance in __init__ to
+    the mock or real implementation, so the hot path does not re-check the
+    mode. measure_distance(max_cm=None) is the same method unless
+    config.samples_per_measurement asks for a median of several pings.
+    Likewise the single-ping backend (_ping) is picked once from the
+    library found by _setup_gpio.
     """
 
+    __slots__ = (
+        'config', 'gpio', 'gpio_handle', 'gpio_library', 'running',
+        'start_time', 'measure_distance', 'measure_distance_once',
+        # Scalars copied from config by _cache_config()
+        '_trig_pin', '_echo_pin', '_settle_time', '_settle_after_ns',
+        '_cm_per_ns', '_timeout_ns',
+        '_pulse_ns', '_pulse_us', '_pulse_s', '_precise_trigger', '_samples',
+        '_min', '_max', '_status_bounds',
+        '_status_labels',
+        # Measurement history
+        '_hist', '_hist_size', '_hist_idx', '_hist_count', '_hist_sum',
+        # Echo capture and pacing
+        '_echo', '_echo_callback', '_edge_timing', '_pinger', '_last_ping_ns',
+        '_claimed',
+        # One unrecorded measurement with the active backend, bound in __init__
+        '_ping',
+        # Monitoring producer thread and its hand-off buffer
+        '_producer', '_producer_error', '_readings', '_readings_ready',
+        '_stop_event',
+    )
+
     def __init__(self, config: Optional[HCSR04Config] = None):
         """
         Initialize HC-SR04 sensor
@@ -69,16 +184,60 @@ class HCSR04Sensor:
         """
         self.config = config or DEFAULT_CONFIG
         self.config.validate()
+        self._cache_config()
 
         self.gpio = None
         self.gpio_handle = None
         self.gpio_library = None
         self.running = False
-        self.measurements: List[float] = []
         self.start_time = None
+        self._reset_history()
+        self._echo = _EchoSlot()
+        self._echo_callback = None
+        self._edge_timing = False
+        self._pinger = None
+        self._last_ping_ns = None
+        self._claimed = False
+        self._producer = None
+        self._producer_error = None
+        self._readings = deque(maxlen=_READINGS_MAXLEN)
+        self._readings_ready = threading.Event()
+        self._stop_event = threading.Event()
 
         # Setup GPIO
         self._setup_gpio()
+        self._ping = {
+            "mock": self._measure_distance_mock,
+            "lgpio": self._measure_distance_lgpio if self._pinger is None
+            else self._measure_distance_pinger,
+            "RPi.GPIO": self._measure_distance_rpi_gpio,
+        }[self.gpio_library]
+        self.measure_distance_once = self._measure_mock \
+            if self.gpio_library == "mock" else self._measure_real
+        self.measure_distance = self.measure_distance_once \
+            if self._samples == 1 else self._measure_filtered
+
+    def _cache_config(self):
+        """Copy the scalars used per measurement out of self.config"""
+        config = self.config
+        self._trig_pin = config.trig_pin
+        self._echo_pin = config.echo_pin
+        self._settle_time = config.settle_time
+        self._settle_after_ns = max(
+            _SETTLE_AFTER_NS, int(2 * config.update_interval * 1e9))
+        self._cm_per_ns = config.cm_per_ns_half
+        self._timeout_ns = int(config.echo_timeout * 1e9)
+        self._pulse_ns = int(config.pulse_duration * 1e9)
+        self._pulse_us = max(1, round(config.pulse_duration * 1e6))
+        self._pulse_s = config.pulse_duration
+        self._precise_trigger = config.precise_trigger
+        self._samples = config.samples_per_measurement
+        self._min = config.min_distance
+        self._max = config.max_distance
+        self._status_bounds = config._sorted_boundaries
+        self._status_labels = tuple(
+            _STATUS_LABELS.get(name, name) for name in config._sorted_labels
+        ) + (_VERY_FAR_LABEL,)
 
     def _setup_gpio(self):
         """Setup GPIO library and pins"""
@@ -93,8 +252,22 @@ class HCSR04Sensor:
             import lgpio
             self.gpio = lgpio
             self.gpio_library = "lgpio"
+            if Pinger is not None:
+                # The C fast path opens the chip and claims the pins itself
+                self._pinger = Pinger(
+                    0, self.config.trig_pin, self.config.echo_pin)
+                print("Using lgpio library with C fast path")
+                return
+
             self.gpio_handle = lgpio.gpiochip_open(0)
             print("Using lgpio library (recommended for Raspberry Pi 5)")
+
+            # Claim pins once; the kernel timestamps echo edges for us
+            self._claim_lgpio_pins()
+            self._echo_callback = lgpio.callback(
+                self.gpio_handle, self.config.echo_pin, lgpio.BOTH_EDGES,
+                self._on_echo_edge)
+            self._edge_timing = True
         except ImportError:
             # Fallback to RPi.GPIO
             try:
@@ -102,6 +275,11 @@ class HCSR04Sensor:
                 self.gpio = GPIO
                 self.gpio_library = "RPi.GPIO"
                 print("Using RPi.GPIO library (fallback option)")
+
+                # Configure pins once instead of on every measurement
+                GPIO.setmode(GPIO.BCM)
+                GPIO.setup(self.config.trig_pin, GPIO.OUT, initial=GPIO.LOW)
+                GPIO.setup(self.config.echo_pin, GPIO.IN)
             except ImportError:
                 print(
                     "Error: No GPIO library available. Please install lgpio or RPi.GPIO")
@@ -109,68 +287,135 @@ class HCSR04Sensor:
                 self.gpio = MockGPIO()
                 self.gpio_library = "mock"
 
-    def measure_distance(self) -> Optional[float]:
+    def _claim_lgpio_pins(self):
+        """Claim TRIG and ECHO on the lgpio handle opened by _setup_gpio"""
+        lgpio = self.gpio
+        h = self.gpio_handle
+        try:
+            lgpio.gpio_claim_output(h, self._trig_pin, 0)
+            lgpio.gpio_claim_alert(h, self._echo_pin, lgpio.BOTH_EDGES)
+        except lgpio.error as e:
+            # Usually "GPIO busy": another process or sensor holds a pin.
+            # Closing the handle releases anything claimed above.
+            lgpio.gpiochip_close(h)
+            self.gpio_handle = None
+            raise OSError(
+                f"Could not claim GPIO {self._trig_pin}/{self._echo_pin}: {e}"
+            ) from e
+        self._claimed = True
+
+    def _measure_real(self, max_cm: Optional[float] = None) -> Optional[float]:
         """
         Measure distance using HC-SR04 sensor
 
+        Args:
+            max_cm: Only look for objects up to this distance. The echo
+                timeout is shortened to match, so misses return sooner.
+
         Returns:
             Distance in centimeters, or None if measurement failed
         """
-        if self.gpio_library == "mock":
-            return self._measure_distance_mock()
-        elif self.gpio_library == "lgpio":
-            return self._measure_distance_lgpio()
-        elif self.gpio_library == "RPi.GPIO":
-            return self._measure_distance_rpi_gpio()
-        else:
+        return self._record(self._ping(max_cm=max_cm))
+
+    def _measure_mock(self, max_cm: Optional[float] = None) -> Optional[float]:
+        """Mock counterpart of _measure_real"""
+        return self._record(self._measure_distance_mock(max_cm))
+
+    def _measure_filtered(self, max_cm: Optional[float] = None) -> Optional[float]:
+        """measure_distance for samples_per_measurement > 1: recorded median"""
+        return self._record(self._median_of(self._samples, max_cm))
+
+    def measure_distance_median(self, n: int = 5) -> Optional[float]:
+        """
+        Take n back-to-back measurements and return their median
+
+        Pings follow each other at the datasheet minimum spacing. Failed
+        pings are dropped before taking the median.
+
+        Args:
+            n: Number of pings
+
+        Returns:
+            Median distance in centimeters, or None if every ping failed
+        """
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        return self._record(self._median_of(n))
+
+    def _median_of(self, n: int, max_cm: Optional[float] = None) -> Optional[float]:
+        """Median of n pings, without recording it; failed pings are dropped"""
+        if n == 1:
+            return self._ping(max_cm)
+
+        if n == 3:
+            a = self._ping(max_cm)
+            b = self._ping(max_cm)
+            c = self._ping(max_cm)
+            if a is not None and b is not None and c is not None:
+                # Median of three without sorting: drop the extremes
+                return round((a + b + c) - max(a, b, c) - min(a, b, c), 2)
+            values = [v for v in (a, b, c) if v is not None]
+            return statistics.median_low(values) if values else None
+
+        buf = array.array('d', [0.0] * n)
+        count = 0
+        for _ in range(n):
+            distance = self._ping(max_cm)
+            if distance is not None:
+                buf[count] = distance
+                count += 1
+
+        if not count:
             return None
+        return statistics.median_low(buf[:count])
+
+    def _limits(self, max_cm: Optional[float]):
+        """Echo timeout (ns) and upper distance bound for one measurement"""
+        if max_cm is None:
+            return self._timeout_ns, self._max
+        return (int(self.config.timeout_for_range(max_cm) * 1e9),
+                min(max_cm, self._max))
 
-    def _measure_distance_mock(self) -> float:
+    def _measure_distance_mock(self, max_cm: Optional[float] = None) -> Optional[float]:
         """Mock distance measurement for testing"""
         time.sleep(0.1)
         distance = random.uniform(
             self.config.mock_min_distance,
             self.config.mock_max_distance
         )
+        if max_cm is not None and distance > max_cm:
+            return None
         return round(distance, 2)
 
-    def _measure_distance_lgpio(self) -> Optional[float]:
+    def _measure_distance_lgpio(self, max_cm: Optional[float] = None) -> Optional[float]:
         """Measure distance using lgpio library"""
         try:
-            # Setup GPIO pins
-            self.gpio.gpio_claim_output(self.gpio_handle, self.config.trig_pin)
-            self.gpio.gpio_claim_input(self.gpio_handle, self.config.echo_pin)
-
-            # Ensure trigger pin is low initially
-            self.gpio.gpio_write(self.gpio_handle, self.config.trig_pin, 0)
-            time.sleep(self.config.settle_time)
+            # Sleep until the falling echo edge instead of spinning on the pin
+            timeout_ns = self._start(max_cm)
+            self._echo.done.wait(timeout_ns / 1e9)
+            return self._collect()
 
-            # Send trigger pulse
-            self.gpio.gpio_write(self.gpio_handle, self.config.trig_pin, 1)
-            time.sleep(self.config.pulse_duration)
-            self.gpio.gpio_write(self.gpio_handle, self.config.trig_pin, 0)
+        except Exception as e:
+            print(f"Error during lgpio measurement: {e}")
+            return None
 
-            # Wait for echo start
-            timeout_start = time.time()
-            while self.gpio.gpio_read(self.gpio_handle, self.config.echo_pin) == 0:
-                if time.time() - timeout_start > self.config.echo_timeout:
-                    return None
-                pulse_start = time.time()
+    def _measure_distance_pinger(self, max_cm: Optional[float] = None) -> Optional[float]:
+        """Measure distance with the C fast path (GIL released while timing)"""
+        try:
+            timeout_ns, max_distance = self._limits(max_cm)
 
-            # Wait for echo end
-            timeout_start = time.time()
-            while self.gpio.gpio_read(self.gpio_handle, self.config.echo_pin) == 1:
-                if time.time() - timeout_start > self.config.echo_timeout:
-                    return None
-                pulse_end = time.time()
+            # TRIG is left low after every pulse, so settling is just a wait
+            self._pace()
+            width_ns = self._pinger.ping(self._pulse_ns, timeout_ns)
+            if width_ns is None:
+                return None
 
-            # Calculate distance
-            pulse_duration = pulse_end - pulse_start
-            distance = (pulse_duration * self.config.sound_speed) / \
-                self.config.round_trip_divisor
+            # The C side only times the echo; conversion stays here so it
+            # follows update_environment()
+            distance = width_ns * self._cm_per_ns
 
-            # Validate range
-            if distance < self.config.min_distance or distance > self.config.max_distance:
+            # Validate range; max_distance may be below min for a small max_cm
+            if not self._min <= distance <= max_distance:
                 return None
 
             return round(distance, 2)
@@ -179,43 +424,208 @@ class HCSR04Sensor:
             print(f"Error during lgpio measurement: {e}")
             return None
 
-    def _measure_distance_rpi_gpio(self) -> Optional[float]:
+    def _on_echo_edge(self, chip, gpio, level, tick):
+        """lgpio alert callback: record echo edge timestamps (nanoseconds)"""
+        echo = self._echo
+        if echo.state != _PENDING:
+            return
+        if level == 1:
+            echo.t_rise = tick
+        elif level == 0 and echo.t_rise:
+            echo.t_fall = tick
+            echo.state = _DONE
+            echo.done.set()
+
+    def start_measurement(self, max_cm: Optional[float] = None):
+        """
+        Trigger a measurement without waiting for the echo
+
+        Collect the result with poll_result(). With lgpio the echo edges are
+        captured in the background. If the sensor has to settle or keep the
+        minimum trigger spacing first, the trigger is held back rather than
+        slept on, and sent by a later measurement_pending or poll_result()
+        check once it is due. With RPi.GPIO or the C fast path the
+        measurement is taken synchronously (settling included) and
+        poll_result() returns it straight away.
+
+        Args:
+            max_cm: Only look for objects up to this distance, as for
+                measure_distance()
+        """
+        self._start(max_cm, block=False)
+
+    def _pace_delay_ns(self, now: int) -> int:
+        """Nanoseconds to hold the next trigger for settling or trigger spacing"""
+        last = self._last_ping_ns
+        if last is None or now - last > self._settle_after_ns:
+            return int(self._settle_time * 1e9)
+        return max(0, _MIN_PING_GAP_NS - (now - last))
+
+    def _pace(self):
+        """Sleep until the next trigger may be sent"""
+        delay_ns = self._pace_delay_ns(time.perf_counter_ns())
+        if delay_ns:
+            time.sleep(delay_ns / 1e9)
+        self._last_ping_ns = time.perf_counter_ns()
+
+    def _fire(self, timeout_ns: int):
+        """Arm the echo slot and send the trigger pulse"""
+        echo = self._echo
+        # Arm the slot before the pulse so the rising edge is not missed
+        echo.deadline = time.perf_counter_ns() + timeout_ns
+        echo.state = _PENDING
+
+        # Send trigger pulse: one high/low cycle timed by lgpio itself
+        self.gpio.tx_pulse(self.gpio_handle, self._trig_pin,
+                           self._pulse_us, self._pulse_us, 0, 1)
+
+    def _fire_if_due(self):
+        """Send a trigger held back by start_measurement() once it is due"""
+        echo = self._echo
+        if echo.state == _SCHEDULED:
+            now = time.perf_counter_ns()
+            if now >= echo.fire_at:
+                self._last_ping_ns = now
+                self._fire(echo.timeout_ns)
+
+    def _start(self, max_cm: Optional[float] = None, block: bool = True) -> int:
+        """
+        Arm the echo slot and fire the trigger pulse; returns the echo timeout (ns)
+
+        With block=False an edge-timed trigger that has to wait for pacing
+        is scheduled instead (see _fire_if_due).
+        """
+        timeout_ns, max_distance = self._limits(max_cm)
+        echo = self._echo
+        echo.t_rise = 0
+        echo.t_fall = 0
+        echo.max_distance = max_distance
+        echo.result = None
+        echo.done.clear()
+
+        if self._edge_timing:
+            # TRIG was claimed low and every pulse ends low
+            if block:
+                self._pace()
+                self._fire(timeout_ns)
+                return timeout_ns
+
+            now = time.perf_counter_ns()
+            delay_ns = self._pace_delay_ns(now)
+            if delay_ns:
+                echo.fire_at = now + delay_ns
+                echo.timeout_ns = timeout_ns
+                echo.state = _SCHEDULED
+            else:
+                self._last_ping_ns = now
+                self._fire(timeout_ns)
+        elif self.gpio_library == "mock":
+            distance = random.uniform(
+                self.config.mock_min_distance,
+                self.config.mock_max_distance
+            )
+            if max_cm is None or distance <= max_cm:
+                echo.result = round(distance, 2)
+            echo.deadline = time.perf_counter_ns() + 100_000_000
+            echo.state = _PENDING
+        else:
+            echo.result = self._ping(max_cm)
+            echo.state = _DONE
+        return timeout_ns
+
+    @property
+    def measurement_pending(self) -> bool:
+        """Whether a measurement started by start_measurement() is still in flight"""
+        self._fire_if_due()
+        echo = self._echo
+        return echo.state == _SCHEDULED or (
+            echo.state == _PENDING and time.perf_counter_ns() < echo.deadline)
+
+    def poll_result(self) -> Optional[float]:
+        """
+        Collect the result of start_measurement()
+
+        Returns:
+            Distance in centimeters, or None if the measurement is still
+            pending (see measurement_pending) or failed
+        """
+        return self._record(self._collect())
+
+    def _collect(self) -> Optional[float]:
+        """Turn the echo slot into a distance once the measurement is done"""
+        self._fire_if_due()
+        echo = self._echo
+
+        if echo.state == _SCHEDULED:
+            return None
+        if echo.state == _PENDING:
+            if time.perf_counter_ns() < echo.deadline:
+                return None
+            if self.gpio_library != "mock":
+                # Echo timeout
+                echo.state = _IDLE
+                return None
+            echo.state = _DONE
+
+        if echo.state != _DONE:
+            return None
+        echo.state = _IDLE
+
+        if not self._edge_timing:
+            return echo.result
+
+        # Calculate distance
+        distance = (echo.t_fall - echo.t_rise) * self._cm_per_ns
+
+        # Validate range; max_distance may be below min for a small max_cm
+        if not self._min <= distance <= echo.max_distance:
+            return None
+
+        return round(distance, 2)
+
+    def _measure_distance_rpi_gpio(self, max_cm: Optional[float] = None) -> Optional[float]:
         """Measure distance using RPi.GPIO library"""
         try:
-            # Setup GPIO pins
-            self.gpio.setup(self.config.trig_pin, self.gpio.OUT)
-            self.gpio.setup(self.config.echo_pin, self.gpio.IN)
+            timeout_ns, max_distance = self._limits(max_cm)
+
+            # Bind everything the timing loops touch to locals; the pins
+            # were configured in _setup_gpio
+            read = self.gpio.input
+            write = self.gpio.output
+            trig = self._trig_pin
+            echo = self._echo_pin
+            now = time.perf_counter_ns
 
             # Ensure trigger pin is low initially
-            self.gpio.output(self.config.trig_pin, False)
-            time.sleep(self.config.settle_time)
+            write(trig, False)
+            self._pace()
 
             # Send trigger pulse
-            self.gpio.output(self.config.trig_pin, True)
-            time.sleep(self.config.pulse_duration)
-            self.gpio.output(self.config.trig_pin, False)
+            write(trig, True)
+            if self._precise_trigger:
+                _busy_wait_ns(self._pulse_ns)
+            else:
+                time.sleep(self._pulse_s)
+            write(trig, False)
 
             # Wait for echo start
-            timeout_start = time.time()
-            while self.gpio.input(self.config.echo_pin) == 0:
-                if time.time() - timeout_start > self.config.echo_timeout:
+            timeout_start = now()
+            while read(echo) == 0:
+                if now() - timeout_start > timeout_ns:
                     return None
-                pulse_start = time.time()
+            pulse_start = now()
 
             # Wait for echo end
-            timeout_start = time.time()
-            while self.gpio.input(self.config.echo_pin) == 1:
-                if time.time() - timeout_start > self.config.echo_timeout:
+            while read(echo) == 1:
+                if now() - pulse_start > timeout_ns:
                     return None
-                pulse_end = time.time()
+            pulse_end = now()
 
             # Calculate distance
-            pulse_duration = pulse_end - pulse_start
-            distance = (pulse_duration * self.config.sound_speed) / \
-                self.config.round_trip_divisor
+            distance = (pulse_end - pulse_start) * self._cm_per_ns
 
-            # Validate range
-            if distance < self.config.min_distance or distance > self.config.max_distance:
+            # Validate range; max_distance may be below min for a small max_cm
+            if not self._min <= distance <= max_distance:
                 return None
 
             return round(distance, 2)
@@ -224,40 +634,152 @@ class HCSR04Sensor:
             print(f"Error during RPi.GPIO measurement: {e}")
             return None
 
+    def update_environment(self, temp_c: float, humidity_pct: float = 0.0):
+        """
+        Compensate the speed of sound for air temperature and humidity
+
+        Args:
+            temp_c: Air temperature in degrees Celsius
+            humidity_pct: Relative humidity in percent
+        """
+        config = self.config.with_environment(temp_c, humidity_pct)
+        config.validate()
+        self.config = config
+        self._cache_config()
+
     def get_distance_status(self, distance: float) -> str:
         """Get status indicator for distance"""
-        if distance < 1.0:
-            return "🔴 Extremely Close"
-        elif distance < self.config.distance_thresholds['very_close']:
-            return "🟢 Very Close"
-        elif distance < self.config.distance_thresholds['close']:
-            return "🟢 Close"
-        elif distance < self.config.distance_thresholds['medium']:
-            return "🟡 Medium"
-        elif distance < self.config.distance_thresholds['far']:
-            return "🟠 Far"
+        if distance < _EXTREMELY_CLOSE:
+            return _EXTREMELY_CLOSE_LABEL
+        # Thresholds are sorted, so the first one above distance is found by bisection
+        return self._status_labels[
+            bisect_right(self._status_bounds, distance)]
+
+    def reset_statistics(self):
+        """Forget recorded measurements so get_statistics() starts afresh"""
+        self._reset_history()
+
+    def _reset_history(self):
+        """Clear the measurement history used for statistics"""
+        size = self.config.stats_window
+        if np is not None:
+            self._hist = np.empty(size, dtype=np.float64)
         else:
-            return "🔴 Very Far"
+            self._hist = [0.0] * size
+        self._hist_size = size
+        self._hist_idx = 0
+        self._hist_count = 0
+        self._hist_sum = 0.0
+
+    def _record(self, distance: Optional[float]) -> Optional[float]:
+        """Add a successful measurement to the history and pass it through"""
+        if distance is not None:
+            hist = self._hist
+            idx = self._hist_idx
+            # Keep a running sum so the average is O(1). The buffer is
+            # float64 so readings come back exactly as they were rounded
+            if self._hist_count < self._hist_size:
+                self._hist_count += 1
+            else:
+                self._hist_sum -= float(hist[idx])
+            hist[idx] = distance
+            self._hist_sum += distance
+            self._hist_idx = (idx + 1) % self._hist_size
+        return distance
+
+    @property
+    def measurements(self) -> List[float]:
+        """Recent successful measurements, oldest first"""
+        count = self._hist_count
+        size = self._hist_size
+        start = (self._hist_idx - count) % size
+        return [float(self._hist[(start + i) % size])
+                for i in range(count)]
 
     def get_statistics(self) -> dict:
         """Get measurement statistics"""
-        if not self.measurements:
+        count = self._hist_count
+        if not count:
             return {}
 
+        # Order does not matter for the reductions, so use the filled prefix
+        view = self._hist[:count]
+        if np is not None:
+            minimum = float(view.min())
+            maximum = float(view.max())
+        else:
+            minimum = min(view)
+            maximum = max(view)
+        average = self._hist_sum / count
+
         return {
-            'count': len(self.measurements),
-            'average': sum(self.measurements) / len(self.measurements),
-            'minimum': min(self.measurements),
-            'maximum': max(self.measurements),
-            'range': max(self.measurements) - min(self.measurements),
+            'count': count,
+            'average': average,
+            'minimum': minimum,
+            'maximum': maximum,
+            'range': maximum - minimum,
             'duration': time.time() - self.start_time if self.start_time else 0
         }
 
+    def _measure_loop(self):
+        """
+        Monitoring producer: measure and timestamp only
+
+        Readings go to self._readings for start_monitoring to record and
+        print, so terminal I/O never delays a measurement. If a measurement
+        raises, the error is kept in self._producer_error and monitoring
+        stops; start_monitoring re-raises it.
+        """
+        readings = self._readings
+        ready = self._readings_ready
+        stop = self._stop_event
+        interval = self.config.update_interval
+        samples = self._samples
+        try:
+            # Schedule against absolute deadlines so the time spent
+            # measuring does not stretch the period
+            deadline = time.monotonic()
+            while self.running:
+                distance = self._median_of(samples)
+                readings.append((time.time(), distance))
+                ready.set()
+
+                deadline += interval
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    if stop.wait(delay):
+                        break
+                else:
+                    # Overran the period: restart the schedule from now
+                    # rather than firing a burst of late measurements
+                    deadline = time.monotonic()
+        except Exception as e:
+            self._producer_error = e
+        finally:
+            # Let the consumer drain what is left and return
+            self.running = False
+            ready.set()
+
     def start_monitoring(self, callback: Optional[Callable[[float, str], None]] = None):
-        """Start continuous distance monitoring"""
+        """
+        Start continuous distance monitoring
+
+        Measurements run on a background thread; this thread records them,
+        invokes the callback and prints. Blocks until stop_monitoring() or
+        Ctrl+C.
+
+        Raises:
+            Exception: Whatever a measurement raised on the background
+                thread, after the readings taken before it are handled
+        """
         self.running = True
         self.start_time = time.time()
-        self.measurements.clear()
+        self._reset_history()
+        self._readings.clear()
+        self._readings_ready.clear()
+        self._stop_event.clear()
+        self._producer_error = None
+        measured = 0
 
         print("=" * 60)
         print("           HC-SR04 REAL-TIME DISTANCE SENSOR")
@@ -271,44 +793,59 @@ class HCSR04Sensor:
         print("Press Ctrl+C to stop")
         print("=" * 60)
 
+        write = sys.stdout.write
+        readings = self._readings
+        ready = self._readings_ready
+        # The timestamp only changes once a second, so reformat it lazily
+        stamped_second = None
+        timestamp = ""
+
+        self._producer = threading.Thread(
+            target=self._measure_loop, name="hcsr04-measure", daemon=True)
+        self._producer.start()
+
         try:
-            while self.running:
-                distance = self.measure_distance()
+            while self.running or readings:
+                ready.wait(_CONSUMER_POLL_S)
+                ready.clear()
 
-                if distance is not None:
-                    self.measurements.append(distance)
-                    if len(self.measurements) > 100:
-                        self.measurements.pop(0)
+                while readings:
+                    taken_at, distance = readings.popleft()
+                    if distance is None:
+                        continue
 
+                    self._record(distance)
+                    measured += 1
                     status = self.get_distance_status(distance)
-                    timestamp = time.strftime("%H:%M:%S")
 
                     if callback:
                         callback(distance, status)
                     else:
-                        print(
-                            f"[{timestamp}] Distance: {distance:6.2f} cm {status}")
+                        second = int(taken_at)
+                        if second != stamped_second:
+                            stamped_second = second
+                            timestamp = time.strftime(
+                                "%H:%M:%S", time.localtime(second))
+                        write(_READING_FMT(timestamp, distance, status))
 
                     # Show statistics every 5 measurements
-                    if len(self.measurements) % 5 == 0 and len(self.measurements) > 0:
-                        stats = self.get_statistics()
-                        print(
-                            f"    Stats: Avg={stats['average']:5.1f}, Min={stats['minimum']:5.1f}, Max={stats['maximum']:5.1f} cm")
-                        print(
-                            f"    Running for: {stats['duration']:.1f}s, Total: {stats['count']}")
-                        print("-" * 40)
+                    if measured % 5 == 0:
+                        write(_STATS_FMT(self.get_statistics()))
+                        sys.stdout.flush()
 
-                time.sleep(self.config.update_interval)
+            if self._producer_error is not None:
+                raise self._producer_error
 
         except KeyboardInterrupt:
             print("\n" + "=" * 50)
             print("Monitoring stopped by user")
         finally:
+            self.stop_monitoring()
             self._show_final_statistics()
 
     def _show_final_statistics(self):
         """Display final statistics"""
-        if self.measurements:
+        if self._hist_count:
             stats = self.get_statistics()
             print(f"\n📈 FINAL STATISTICS:")
             print(f"   Total measurements: {stats['count']}")
@@ -316,14 +853,32 @@ class HCSR04Sensor:
             print(f"   Final average: {stats['average']:.2f} cm")
 
     def stop_monitoring(self):
-        """Stop continuous monitoring"""
+        """Stop continuous monitoring and wait for the measurement thread"""
         self.running = False
+        self._stop_event.set()
+        self._readings_ready.set()
+        producer = self._producer
+        if producer is not None and producer is not threading.current_thread():
+            producer.join()
+            self._producer = None
 
     def cleanup(self):
         """Cleanup GPIO resources"""
-        if self.gpio_library == "lgpio" and self.gpio_handle:
+        if self.gpio_library == "lgpio" and self._pinger is not None:
+            self._pinger.close()
+            self._pinger = None
+            print("lgpio cleanup completed")
+        elif self.gpio_library == "lgpio" and self.gpio_handle is not None:
             try:
+                if self._echo_callback is not None:
+                    self._echo_callback.cancel()
+                    self._echo_callback = None
+                if self._claimed:
+                    self.gpio.gpio_free(self.gpio_handle, self._trig_pin)
+                    self.gpio.gpio_free(self.gpio_handle, self._echo_pin)
+                    self._claimed = False
                 self.gpio.gpiochip_close(self.gpio_handle)
+                self.gpio_handle = None
                 print("lgpio cleanup completed")
             except:
                 pass
@@ -345,9 +900,14 @@ class HCSR04Sensor:
         self.cleanup()
 
 
-def main():
-    """Main function for command-line usage"""
-    sensor = HCSR04Sensor()
+def main(config: Optional[HCSR04Config] = None):
+    """
+    Main function for command-line usage
+
+    Args:
+        config: Sensor configuration (uses DEFAULT_CONFIG if None)
+    """
+    sensor = HCSR04Sensor(config)
     try:
         sensor.start_monitoring()
     except Exception as e:
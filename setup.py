@@ -4,7 +4,8 @@ Setup script for HC-SR04 Ultrasonic Sensor Driver
 A professional Python driver for HC-SR04 ultrasonic distance sensors on Raspberry Pi
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
+from setuptools.command.build_ext import build_ext
 import os
 
 # Read the README file for long description
@@ -17,6 +18,66 @@ def read_requirements():
     with open("requirements.txt", "r", encoding="utf-8") as fh:
         return [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
+# Optional C fast path for the lgpio ping loop (needs Cython and liblgpio).
+# Cython is only needed at build time, which pip's isolated build cannot
+# see, so install it first and use `pip install --no-build-isolation`.
+def read_extensions():
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+    extension = Extension(
+        "hcsr04_driver._ping",
+        sources=["hcsr04_driver/_ping.pyx"],
+        libraries=["lgpio"],
+    )
+    return cythonize([extension], language_level=3, quiet=True)
+
+# Opt-in ahead-of-time compilation of the pure-Python config module with
+# mypyc. mypy is a build requirement, not a runtime one, and pip's isolated
+# build cannot see it, so install it first and build without isolation:
+#   pip install mypy setuptools wheel
+#   HCSR04_MYPYC=1 pip install --no-build-isolation .
+# The .py source is still installed and used wherever the build is skipped.
+def read_mypyc_modules():
+    if os.environ.get("HCSR04_MYPYC") != "1":
+        return []
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        print("HCSR04_MYPYC=1 but mypyc is not installed; skipping")
+        return []
+    # Only config.py is compiled; sensor.py binds its GPIO backends at
+    # runtime, so errors in modules it pulls in are not reported
+    return mypycify([
+        "--follow-imports=silent",
+        "hcsr04_driver/config.py",
+    ], opt_level="3")
+
+class OptionalBuildExt(build_ext):
+    """Build C extensions if possible, otherwise install pure Python"""
+
+    def initialize_options(self):
+        super().initialize_options()
+        self.skipped = []
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except Exception as e:
+            print(f"Skipping optional C extension {ext.name}: {e}")
+            self.skipped.append(ext)
+
+    def copy_extensions_to_source(self):
+        # --inplace: a skipped extension has nothing to copy, but the ones
+        # that did build still need to be
+        extensions = self.extensions
+        self.extensions = [ext for ext in extensions if ext not in self.skipped]
+        try:
+            super().copy_extensions_to_source()
+        finally:
+            self.extensions = extensions
+
 setup(
     name="hc-sr04-driver",
     version="1.0.0",
@@ -32,6 +93,8 @@ setup(
         "Documentation": "https://github.com/kagamirudo/hc-sr04-driver#readme",
     },
     packages=find_packages(),
+    ext_modules=read_extensions() + read_mypyc_modules(),
+    cmdclass={"build_ext": OptionalBuildExt},
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -51,6 +114,9 @@ setup(
     python_requires=">=3.8",
     install_requires=read_requirements(),
     extras_require={
+        "numpy": [
+            "numpy>=1.17",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
@@ -60,7 +126,7 @@ setup(
     },
     entry_points={
         "console_scripts": [
-            "hc-sr04=sensor_hcsr04_lgpio:main",
+            "hc-sr04=hcsr04_driver.sensor:main",
             "hc-sr04-test=test_hcsr04:main",
         ],
     },
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for HCSR04Config
+"""
+
+import dataclasses
+
+import pytest
+
+from hcsr04_driver import HCSR04Config, Thresholds
+
+
+def test_config_is_frozen():
+    config = HCSR04Config()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.max_distance = 200.0
+
+
+def test_replace_rederives_constants():
+    config = dataclasses.replace(HCSR04Config(), sound_speed=34000.0)
+    assert config.sound_speed == 34000.0
+    assert config.cm_per_second_half == 17000.0
+    assert config.cm_per_ns_half == pytest.approx(17000.0 / 1e9)
+
+
+def test_config_is_hashable():
+    assert hash(HCSR04Config()) == hash(HCSR04Config())
+    assert HCSR04Config() != HCSR04Config(trig_pin=17)
+
+
+def test_dict_round_trip():
+    config = HCSR04Config(trig_pin=17, max_distance=250.0,
+                          distance_thresholds={'very_close': 3, 'close': 20,
+                                               'medium': 80, 'far': 150})
+    assert HCSR04Config.from_dict(config.to_dict()) == config
+
+
+@pytest.mark.parametrize("field, value, message", [
+    ('min_distance', -1, "min_distance"),
+    ('max_distance', 0.2, "max_distance"),
+    ('settle_time', -1, "settle_time"),
+    ('pulse_duration', -1, "pulse_duration"),
+    ('sound_speed', -1, "sound_speed"),
+    ('round_trip_divisor', 0, "round_trip_divisor"),
+    ('echo_timeout', -1, "echo_timeout"),
+    ('update_interval', -1, "update_interval"),
+    ('stats_window', 0, "stats_window"),
+])
+def test_validate_rejects(field, value, message):
+    config = HCSR04Config(**{field: value})
+    with pytest.raises(ValueError, match=message):
+        config.validate()
+
+
+def test_validate_accepts_defaults():
+    assert HCSR04Config().validate() is True
+
+
+def test_thresholds_accept_dict_and_name_lookup():
+    thresholds = HCSR04Config(distance_thresholds={
+        'very_close': 3, 'close': 20, 'medium': 80, 'far': 150,
+    }).distance_thresholds
+    assert thresholds == Thresholds(3.0, 20.0, 80.0, 150.0)
+    assert thresholds['close'] == thresholds.close == thresholds[1] == 20.0
+    with pytest.raises(KeyError):
+        thresholds['near']
+
+
+def test_with_environment_rederives_echo_timeout():
+    cold = HCSR04Config().with_environment(-20.0)
+    assert cold.sound_speed == pytest.approx(31928.0)
+    assert cold.echo_timeout == cold.timeout_for_range(cold.max_distance)
+    assert cold.echo_timeout > HCSR04Config().echo_timeout
+
+
+def test_with_environment_keeps_explicit_echo_timeout():
+    config = HCSR04Config(echo_timeout=0.05).with_environment(-20.0)
+    assert config.echo_timeout == 0.05
+
+
+def test_dict_round_trip_keeps_echo_timeout_derived():
+    config = HCSR04Config()
+    assert config.to_dict()['echo_timeout'] is None
+    copy = HCSR04Config.from_dict(config.to_dict())
+    assert copy.echo_timeout == config.echo_timeout
+    assert (copy.with_environment(-20.0).echo_timeout
+            == config.with_environment(-20.0).echo_timeout)
+
+    explicit = HCSR04Config(echo_timeout=0.05)
+    assert HCSR04Config.from_dict(explicit.to_dict()).with_environment(
+        -20.0).echo_timeout == 0.05
+
+
+def test_build_config_accepts_older_config_py(monkeypatch):
+    import config as settings
+    import sensor_hcsr04_lgpio
+
+    # A config.py that predates PRECISE_TRIGGER and the derived timeout
+    monkeypatch.delattr(settings, 'PRECISE_TRIGGER')
+    monkeypatch.delattr(settings, 'ECHO_TIMEOUT')
+    config = sensor_hcsr04_lgpio.build_config()
+    assert config.precise_trigger is True
+    assert config.echo_timeout == config.timeout_for_range(config.max_distance)
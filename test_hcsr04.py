@@ -16,7 +16,10 @@ def test_hcsr04_timing():
     print(f"SETTLE_TIME: {SETTLE_TIME} seconds")
     print(
         f"PULSE_DURATION: {PULSE_DURATION} seconds ({PULSE_DURATION * 1000000:.1f} microseconds)")
-    print(f"ECHO_TIMEOUT: {ECHO_TIMEOUT} seconds")
+    if ECHO_TIMEOUT is None:
+        print("ECHO_TIMEOUT: derived from MAX_DISTANCE")
+    else:
+        print(f"ECHO_TIMEOUT: {ECHO_TIMEOUT} seconds")
     print(f"SOUND_SPEED: {SOUND_SPEED_CM_S} cm/s")
     print(f"Valid Range: {MIN_DISTANCE}-{MAX_DISTANCE} cm")
     print("=" * 40)
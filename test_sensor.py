@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Tests for HCSR04Sensor in mock mode
+"""
+
+import time
+
+import pytest
+
+from hcsr04_driver import HCSR04Config
+import hcsr04_driver.sensor as sensor_module
+from hcsr04_driver.sensor import HCSR04Sensor, _DONE
+
+
+@pytest.fixture
+def make_sensor(request):
+    """Factory for mock-mode sensors; each is cleaned up after the test"""
+    def make(**config):
+        s = HCSR04Sensor(HCSR04Config(use_mock_gpio=True, **config))
+        request.addfinalizer(s.cleanup)
+        return s
+    return make
+
+
+@pytest.fixture
+def sensor(make_sensor):
+    """Mock-mode sensor with the default configuration"""
+    return make_sensor()
+
+
+def _scripted_pings(sensor, values):
+    """Replace the single-ping backend with one returning values in order"""
+    pings = iter(values)
+    seen = []
+
+    def ping(max_cm=None):
+        seen.append(max_cm)
+        return next(pings)
+
+    sensor._ping = ping
+    return seen
+
+
+def _edge_result(sensor, distance_cm, max_cm=None):
+    """Run _collect() on an edge-timed echo slot for an echo from distance_cm"""
+    sensor._edge_timing = True
+    _, max_distance = sensor._limits(max_cm)
+    echo = sensor._echo
+    echo.t_rise = 0
+    echo.t_fall = round(distance_cm / sensor._cm_per_ns)
+    echo.max_distance = max_distance
+    echo.state = _DONE
+    return sensor._collect()
+
+
+def test_range_check_accepts_valid_echo(sensor):
+    assert _edge_result(sensor, 0.6) == pytest.approx(0.6, abs=0.01)
+
+
+def test_range_check_rejects_echo_below_min_when_max_cm_is_smaller(sensor):
+    # max_cm below min_distance: nothing can be in range
+    assert sensor.config.min_distance == 0.5
+    assert _edge_result(sensor, 0.4, max_cm=0.3) is None
+    assert _edge_result(sensor, 0.2, max_cm=0.3) is None
+
+
+def test_settle_threshold_clears_update_interval(sensor, make_sensor):
+    # The default 1s interval must not sit on the settle boundary
+    assert sensor._settle_after_ns == 2_000_000_000
+    assert make_sensor(update_interval=0.1)._settle_after_ns == 1_000_000_000
+
+
+def test_median_of_three_drops_extremes(make_sensor):
+    sensor = make_sensor(samples_per_measurement=3)
+    _scripted_pings(sensor, [12.5, 250.0, 11.0])
+    assert sensor.measure_distance() == 12.5
+    assert sensor.measurements == [12.5]
+
+
+@pytest.mark.parametrize("pings, expected", [
+    ([None, 20.0, None], 20.0),
+    ([30.0, None, 10.0], 10.0),
+    ([None, None, None], None),
+])
+def test_median_of_three_skips_failed_pings(pings, expected, make_sensor):
+    sensor = make_sensor(samples_per_measurement=3)
+    _scripted_pings(sensor, pings)
+    assert sensor.measure_distance() == expected
+
+
+def test_median_of_many_skips_failed_pings(sensor):
+    _scripted_pings(sensor, [40.0, None, 10.0, None, 20.0])
+    assert sensor.measure_distance_median(5) == 20.0
+
+
+def test_median_forwards_max_cm(make_sensor):
+    sensor = make_sensor(samples_per_measurement=3)
+    seen = _scripted_pings(sensor, [1.0, 2.0, 3.0])
+    sensor.measure_distance(max_cm=50)
+    assert seen == [50, 50, 50]
+
+
+def test_samples_per_measurement_must_be_positive(make_sensor):
+    with pytest.raises(ValueError, match="samples_per_measurement"):
+        HCSR04Config(samples_per_measurement=0).validate()
+    with pytest.raises(ValueError):
+        make_sensor(samples_per_measurement=0)
+
+
+def test_measure_distance_median_rejects_zero(sensor):
+    with pytest.raises(ValueError):
+        sensor.measure_distance_median(0)
+
+
+def _wait_for_result(sensor):
+    while sensor.measurement_pending:
+        time.sleep(0.01)
+    return sensor.poll_result()
+
+
+def test_start_measurement_then_poll_result(sensor):
+    sensor.start_measurement()
+    assert sensor.measurement_pending
+    assert sensor.poll_result() is None
+
+    distance = _wait_for_result(sensor)
+    config = sensor.config
+    assert config.mock_min_distance <= distance <= config.mock_max_distance
+    assert sensor.measurements == [distance]
+    # The slot is consumed by the first successful poll
+    assert not sensor.measurement_pending
+    assert sensor.poll_result() is None
+
+
+def test_start_measurement_honours_max_cm(sensor):
+    sensor.start_measurement(max_cm=sensor.config.mock_min_distance - 1)
+    assert _wait_for_result(sensor) is None
+    assert sensor.measurements == []
+
+
+def test_history_returns_readings_unchanged(sensor):
+    for distance in (19.84, 123.45, 0.61):
+        sensor._record(distance)
+    assert sensor.measurements == [19.84, 123.45, 0.61]
+    stats = sensor.get_statistics()
+    assert stats['minimum'] == 0.61
+    assert stats['maximum'] == 123.45
+
+
+@pytest.mark.parametrize("distance, label", [
+    (0.99, "🔴 Extremely Close"),
+    (1.0, "🟢 Very Close"),
+    (4.99, "🟢 Very Close"),
+    (5.0, "🟢 Close"),
+    (29.99, "🟢 Close"),
+    (30.0, "🟡 Medium"),
+    (100.0, "🟠 Far"),
+    (199.99, "🟠 Far"),
+    (200.0, "🔴 Very Far"),
+])
+def test_distance_status_band_boundaries(sensor, distance, label):
+    # Each threshold is the exclusive upper bound of its band
+    assert sensor.get_distance_status(distance) == label
+
+
+def test_distance_status_sorts_custom_thresholds(make_sensor):
+    sensor = make_sensor(distance_thresholds={
+        'far': 50, 'very_close': 2, 'medium': 20, 'close': 10})
+    assert sensor.get_distance_status(1.5) == "🟢 Very Close"
+    assert sensor.get_distance_status(10) == "🟡 Medium"
+    assert sensor.get_distance_status(49) == "🟠 Far"
+    assert sensor.get_distance_status(50) == "🔴 Very Far"
+
+
+def test_measure_distance_median_records_only_the_median(sensor):
+    _scripted_pings(sensor, [30.0, 10.0, 20.0, 40.0, 50.0])
+    assert sensor.measure_distance_median(5) == 30.0
+    assert sensor.measurements == [30.0]
+
+
+def test_measure_distance_median_of_even_count_is_a_reading(sensor):
+    # median_low picks a real reading rather than averaging the middle two
+    _scripted_pings(sensor, [10.0, 40.0, 20.0, 30.0])
+    assert sensor.measure_distance_median(4) == 20.0
+
+
+def test_max_cm_shortens_timeout_and_range(sensor):
+    timeout_ns, max_distance = sensor._limits(50.0)
+    assert timeout_ns < sensor._limits(None)[0]
+    # Round trip for 50cm is ~2.9ms; the margin plus the trigger-to-echo
+    # allowance must cover it
+    assert timeout_ns == pytest.approx(1_000_000 + 2 * 50 / 34300 * 1.2e9)
+    assert max_distance == 50.0
+    assert _edge_result(sensor, 49.0, max_cm=50.0) == pytest.approx(49.0, abs=0.01)
+    assert _edge_result(sensor, 51.0, max_cm=50.0) is None
+
+
+def test_small_max_cm_leaves_time_for_the_echo_to_start(sensor):
+    # A ~0.6ms round trip on its own would give the sensor no time to
+    # raise ECHO after the trigger
+    timeout_ns, _ = sensor._limits(10.0)
+    assert timeout_ns > 1_000_000 + 2 * 10 / 34300 * 1e9
+
+
+def test_max_cm_miss_is_not_recorded(sensor):
+    assert sensor.measure_distance(max_cm=sensor.config.mock_min_distance - 1) is None
+    assert sensor.measurements == []
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_running_sum_after_wrap_around(monkeypatch, make_sensor, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(sensor_module, "np", None)
+    elif sensor_module.np is None:
+        pytest.skip("numpy not installed")
+    sensor = make_sensor(stats_window=4)
+    readings = [10.5, 20.25, 30.0, 40.75, 50.5, 60.0, 70.25]
+    for distance in readings:
+        sensor._record(distance)
+    kept = readings[-4:]
+    assert sensor.measurements == kept
+    stats = sensor.get_statistics()
+    assert stats['count'] == 4
+    assert stats['average'] == pytest.approx(sum(kept) / 4)
+    assert stats['minimum'] == 40.75
+    assert stats['maximum'] == 70.25
+
+
+def test_monitoring_hands_readings_to_the_callback(make_sensor):
+    sensor = make_sensor(update_interval=0.01)
+    _scripted_pings(sensor, [10.0, None, 20.0, 30.0] + [40.0] * 100)
+    seen = []
+
+    def callback(distance, status):
+        seen.append((distance, status))
+        if len(seen) == 3:
+            sensor.stop_monitoring()
+
+    sensor.start_monitoring(callback)
+    # Failed pings are skipped; readings arrive in order
+    assert seen[:3] == [(10.0, "🟢 Close"), (20.0, "🟢 Close"),
+                        (30.0, "🟡 Medium")]
+    assert not sensor.running
+    assert sensor.measurements == [d for d, _ in seen]
+
+
+def test_monitoring_surfaces_producer_errors(make_sensor):
+    sensor = make_sensor(update_interval=0.01)
+    pings = iter([10.0, 20.0])
+
+    def ping(max_cm=None):
+        for distance in pings:
+            return distance
+        raise RuntimeError("echo pin vanished")
+
+    sensor._ping = ping
+    seen = []
+    with pytest.raises(RuntimeError, match="echo pin vanished"):
+        sensor.start_monitoring(lambda distance, status: seen.append(distance))
+    # Readings taken before the failure are still delivered
+    assert seen == [10.0, 20.0]
+    assert not sensor.running
+
+
+def test_reset_statistics_clears_history(sensor):
+    sensor._record(10.0)
+    sensor.reset_statistics()
+    assert sensor.get_statistics() == {}
+    sensor._record(20.0)
+    assert sensor.measurements == [20.0]
+
+
+class _PulseRecorder:
+    """Stands in for lgpio on an edge-timed sensor; records trigger pulses"""
+
+    def __init__(self):
+        self.pulses = 0
+
+    def tx_pulse(self, *args):
+        self.pulses += 1
+
+    def cleanup(self):
+        pass
+
+
+def test_start_measurement_does_not_sleep_for_pacing(sensor):
+    sensor._edge_timing = True
+    gpio = sensor.gpio = _PulseRecorder()
+
+    started = time.perf_counter()
+    sensor.start_measurement()
+    # settle_time is 100ms; the trigger is scheduled, not slept on
+    assert time.perf_counter() - started < sensor._settle_time / 2
+    assert gpio.pulses == 0
+    assert sensor.measurement_pending
+    assert sensor.poll_result() is None
+
+    time.sleep(sensor._settle_time)
+    assert sensor.measurement_pending
+    assert gpio.pulses == 1